@@ -8,6 +8,7 @@ import django
 from django.conf import settings
 from django.utils.module_loading import autodiscover_modules
 
+from django_components.app_settings import app_settings
 from django_components.logger import logger
 from django_components.utils import search
 
@@ -20,8 +21,6 @@ def autodiscover(map_import_paths: Optional[Callable[[str], str]] = None) -> Lis
     Search for component files and import them. Returns a list of module
     paths of imported files.
     """
-    from django_components.app_settings import app_settings
-
     imported_modules: List[str] = []
 
     if app_settings.AUTODISCOVER:
@@ -13,6 +13,7 @@ from django_components.template_parser import process_aggregate_kwargs
 
 HTML_ATTRS_DEFAULTS_KEY = "defaults"
 HTML_ATTRS_ATTRS_KEY = "attrs"
+HTML_ATTRS_AGGREGATE_PREFIXES = (f"{HTML_ATTRS_ATTRS_KEY}:", f"{HTML_ATTRS_DEFAULTS_KEY}:")
 
 
 class HtmlAttrsNode(Node):
@@ -26,22 +27,24 @@ class HtmlAttrsNode(Node):
         self.default_attrs = default_attrs
         self.kwargs = kwargs
 
-    def render(self, context: Context) -> str:
-        append_attrs: List[Tuple[str, Any]] = []
-        attrs_and_defaults_from_kwargs = {}
-
-        # Resolve kwargs, while also extracting attrs and defaults keys
-        for key, value in self.kwargs:
-            resolved_value = value.resolve(context)
-            if key.startswith(f"{HTML_ATTRS_ATTRS_KEY}:") or key.startswith(f"{HTML_ATTRS_DEFAULTS_KEY}:"):
-                attrs_and_defaults_from_kwargs[key] = resolved_value
-                continue
+        # Whether a kwarg belongs to attrs / defaults, or is appended, depends only on
+        # its key. So we sort the kwargs once here, instead of on each render.
+        self._aggregate_kwargs: List[Tuple[str, FilterExpression]] = []
+        self._append_kwargs: List[Tuple[str, FilterExpression]] = []
+        for key, value in kwargs:
+            if key.startswith(HTML_ATTRS_AGGREGATE_PREFIXES):
+                self._aggregate_kwargs.append((key, value))
             # NOTE: These were already extracted into separate variables, so
             # ignore them here.
             elif key == HTML_ATTRS_ATTRS_KEY or key == HTML_ATTRS_DEFAULTS_KEY:
                 continue
+            else:
+                self._append_kwargs.append((key, value))
 
-            append_attrs.append((key, resolved_value))
+    def render(self, context: Context) -> str:
+        # Resolve kwargs, while also extracting attrs and defaults keys
+        attrs_and_defaults_from_kwargs = {key: value.resolve(context) for key, value in self._aggregate_kwargs}
+        append_attrs: List[Tuple[str, Any]] = [(key, value.resolve(context)) for key, value in self._append_kwargs]
 
         # NOTE: Here we delegate validation to `process_aggregate_kwargs`, which should
         # raise error if the dict includes both `attrs` and `attrs:` keys.
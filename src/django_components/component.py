@@ -1,6 +1,7 @@
 import inspect
 import types
-from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Type, Union
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Tuple, Type, Union
 
 from django.core.exceptions import ImproperlyConfigured
 from django.forms.widgets import Media
@@ -14,6 +15,7 @@ from django.utils.html import escape
 from django.utils.safestring import SafeString, mark_safe
 from django.views import View
 
+from django_components.app_settings import app_settings
 from django_components.component_media import ComponentMediaInput, MediaMeta
 
 # Global registry var and register() function moved to separate module.
@@ -52,6 +54,17 @@ from django_components.utils import gen_id
 
 RENDERED_COMMENT_TEMPLATE = "<!-- _RENDERED {name} -->"
 
+# Lazily created, so that `template_cache_size` is read only once settings are configured
+_template_cache: Optional[Callable[[str], Template]] = None
+
+
+def cached_template(template_string: str) -> Template:
+    """Compile the template string, reusing the Template previously compiled from the same string."""
+    global _template_cache
+    if _template_cache is None:
+        _template_cache = lru_cache(maxsize=app_settings.TEMPLATE_CACHE_SIZE)(Template)
+    return _template_cache(template_string)
+
 
 class ComponentMeta(MediaMeta):
     def __new__(mcs, name: str, bases: Tuple[Type, ...], attrs: Dict[str, Any]) -> Type:
@@ -139,7 +152,7 @@ class Component(View, metaclass=ComponentMeta):
     def get_template(self, context: Context) -> Template:
         template_string = self.get_template_string(context)
         if template_string is not None:
-            return Template(template_string)
+            return cached_template(template_string)
 
         template_name = self.get_template_name(context)
         if template_name is not None:
@@ -500,7 +513,7 @@ class ComponentNode(Node):
         if is_default_slot:
             fill_content: Dict[str, FillContent] = {
                 DEFAULT_SLOT_KEY: FillContent(
-                    content_func=_nodelist_to_slot_render_func(self.fill_nodes[0].nodelist),
+                    content_func=self.fill_nodes[0].content_func,
                     slot_data_var=None,
                     slot_default_var=None,
                 ),
@@ -520,7 +533,7 @@ class ComponentNode(Node):
                 resolved_slot_default_var = fill_node.resolve_slot_default(context, resolved_component_name)
                 resolved_slot_data_var = fill_node.resolve_slot_data(context, resolved_component_name)
                 fill_content[resolved_name] = FillContent(
-                    content_func=_nodelist_to_slot_render_func(fill_node.nodelist),
+                    content_func=fill_node.content_func,
                     slot_default_var=resolved_slot_default_var,
                     slot_data_var=resolved_slot_data_var,
                 )
@@ -6,7 +6,8 @@ You can think of the Context as our storage system.
 """
 
 from collections import namedtuple
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
 
 from django.template import Context, TemplateSyntaxError
 
@@ -129,8 +130,16 @@ def set_provided_context_var(
     # We turn the kwargs into a NamedTuple so that the object that's "provided"
     # is immutable. This ensures that the data returned from `inject` will always
     # have all the keys that were passed to the `provide` tag.
-    tpl_cls = namedtuple("DepInject", provided_kwargs.keys())  # type: ignore[misc]
+    tpl_cls = _get_provided_payload_cls(tuple(provided_kwargs.keys()))
     payload = tpl_cls(**provided_kwargs)
 
     internal_key = _INJECT_CONTEXT_KEY_PREFIX + key
     context[internal_key] = payload
+
+
+# NOTE: Creating a namedtuple class generates and compiles its source, which is slow.
+# Since the keys passed to the `provide` tag come from the template, the same few sets
+# of keys are used over and over, so we reuse the class for the same set of keys.
+@lru_cache(maxsize=256)
+def _get_provided_payload_cls(keys: Tuple[str, ...]) -> Type[Tuple]:
+    return namedtuple("DepInject", keys)  # type: ignore[misc]
@@ -33,7 +33,8 @@ def safe_resolve_dict(
 
 def safe_resolve(context_item: FilterExpression, context: Context) -> Any:
     """Resolve FilterExpressions and Variables in context if possible. Return other items unchanged."""
-    return context_item.resolve(context) if hasattr(context_item, "resolve") else context_item
+    resolve = getattr(context_item, "resolve", None)
+    return resolve(context) if resolve is not None else context_item
 
 
 def resolve_string(
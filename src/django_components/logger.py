@@ -55,10 +55,14 @@ def trace(logger: logging.Logger, message: str, *args: Any, **kwargs: Any) -> No
     }
     ```
     """
+    if _is_trace_enabled(logger):
+        logger.log(actual_trace_level_num, message, *args, **kwargs)
+
+
+def _is_trace_enabled(logger: logging.Logger) -> bool:
     if actual_trace_level_num == -1:
         setup_logging()
-    if logger.isEnabledFor(actual_trace_level_num):
-        logger.log(actual_trace_level_num, message, *args, **kwargs)
+    return logger.isEnabledFor(actual_trace_level_num)
 
 
 def trace_msg(
@@ -75,6 +79,11 @@ def trace_msg(
 
     `"ASSOC SLOT test_slot ID 0088 TO COMP 0087"`
     """
+    # NOTE: This is called several times for each rendered component, slot and fill,
+    # so don't format the message unless TRACE logs are actually enabled.
+    if not _is_trace_enabled(logger):
+        return
+
     msg_prefix = ""
     if action == "ASSOC":
         if not component_id:
@@ -90,4 +99,4 @@ def trace_msg(
 
     # NOTE: When debugging tests during development, it may be easier to change
     # this to `print()`
-    trace(logger, full_msg)
+    logger.log(actual_trace_level_num, full_msg)
@@ -25,6 +25,12 @@ PLACEHOLDER_REGEX = re.compile(
     rb'|<link name="CSS_PLACEHOLDER">'
     rb'|<script name="JS_PLACEHOLDER"></script>'
 )
+# Cheap substring checks that tell whether PLACEHOLDER_REGEX can match at all
+PLACEHOLDER_MARKERS = (
+    b"<!-- _RENDERED ",
+    CSS_DEPENDENCY_PLACEHOLDER.encode("utf-8"),
+    JS_DEPENDENCY_PLACEHOLDER.encode("utf-8"),
+)
 
 
 @sync_and_async_middleware
@@ -66,6 +72,10 @@ class ComponentDependencyMiddleware:
 
 
 def process_response_content(content: bytes) -> bytes:
+    # Responses without components or dependency tags are left as they are
+    if not any(marker in content for marker in PLACEHOLDER_MARKERS):
+        return content
+
     component_names_seen = {match.group("name") for match in COMPONENT_COMMENT_REGEX.finditer(content)}
     all_components = [registry.get(name.decode("utf-8"))("") for name in component_names_seen]
     all_media = join_media(all_components)
@@ -75,7 +85,7 @@ def process_response_content(content: bytes) -> bytes:
 
 
 def add_module_attribute_to_scripts(scripts: str) -> str:
-    return re.sub(SCRIPT_TAG_REGEX, '<script type="module"', scripts)
+    return SCRIPT_TAG_REGEX.sub('<script type="module"', scripts)
 
 
 class DependencyReplacer:
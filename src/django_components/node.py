@@ -1,7 +1,7 @@
 from typing import Callable, List, NamedTuple, Optional
 
 from django.template import Context, Template
-from django.template.base import Node, NodeList, TextNode
+from django.template.base import Node, NodeList, TextNode, VariableNode
 from django.template.defaulttags import CommentNode
 from django.template.loader_tags import ExtendsNode, IncludeNode, construct_relative_path
 
@@ -29,12 +29,14 @@ def walk_nodelist(
 ) -> None:
     """Recursively walk a NodeList, calling `callback` for each Node."""
     node_queue: List[NodeTraverse] = [NodeTraverse(node=node, parent=None) for node in nodes]
-    while len(node_queue):
+    while node_queue:
         traverse = node_queue.pop()
         callback(traverse)
+        # Text and variable nodes are the most common nodes, and they never have children.
+        if isinstance(traverse.node, (TextNode, VariableNode)):
+            continue
         child_nodes = get_node_children(traverse.node, context)
-        child_traverses = [NodeTraverse(node=child_node, parent=traverse) for child_node in child_nodes]
-        node_queue.extend(child_traverses)
+        node_queue.extend(NodeTraverse(node=child_node, parent=traverse) for child_node in child_nodes)
 
 
 def get_node_children(node: Node, context: Optional[Context] = None) -> NodeList:
@@ -1,7 +1,8 @@
 import difflib
 import json
 import re
-from collections import deque
+from collections import defaultdict, deque
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Type, Union
 
 from django.template import Context, Template
@@ -98,6 +99,8 @@ class SlotRef:
     of the slot.
     """
 
+    __slots__ = ("_slot", "_context")
+
     def __init__(self, slot: "SlotNode", context: Context):
         self._slot = slot
         self._context = context
@@ -219,6 +222,9 @@ class FillNode(Node):
         self.is_implicit = is_implicit
         self.slot_data_var_fexp = slot_data_var_fexp
         self.component_id: Optional[str] = None
+        # The fill's render function depends only on the nodelist, so we create it once
+        # here, instead of on each render of the parent component.
+        self.content_func = _nodelist_to_slot_render_func(nodelist)
 
     def render(self, context: Context) -> str:
         raise TemplateSyntaxError(
@@ -386,7 +392,7 @@ def resolve_slots(
 
     slots: Dict[SlotId, Slot] = {}
     # This holds info on which slot (key) has which slots nested in it (value list)
-    slot_children: Dict[SlotId, List[SlotId]] = {}
+    slot_children: Dict[SlotId, List[SlotId]] = defaultdict(list)
 
     def on_node(entry: NodeTraverse) -> None:
         node = entry.node
@@ -420,8 +426,6 @@ def resolve_slots(
                 continue
 
             parent_slot_id = curr_entry.node.node_id
-            if parent_slot_id not in slot_children:
-                slot_children[parent_slot_id] = []
             slot_children[parent_slot_id].append(node.node_id)
             break
 
@@ -581,6 +585,9 @@ def _report_slot_errors(
 name_escape_re = re.compile(r"[^\w]")
 
 
+# NOTE: This is called for each slot on each render, but slot names come from
+# templates, so there's only a limited number of distinct names.
+@lru_cache(maxsize=1024)
 def _escape_slot_name(name: str) -> str:
     """
     Users may define slots with names which are invalid identifiers like 'my slot'.
@@ -5,8 +5,10 @@ Based on Django Slippers v0.6.2 - https://github.com/mixxorz/slippers/blob/main/
 """
 
 import re
+from collections import defaultdict
 from typing import Any, Dict, List, Mapping, Tuple
 
+from django.template import Context
 from django.template.base import (
     FILTER_ARGUMENT_SEPARATOR,
     FILTER_SEPARATOR,
@@ -50,10 +52,16 @@ filter_re = _lazy_re_compile(filter_raw_string, re.VERBOSE)
 
 
 class ComponentsFilterExpression(FilterExpression):
+    # NOTE: FilterExpression defines `__slots__`, so we define them too, otherwise
+    # every instance would get a `__dict__`.
+    __slots__ = ("is_literal",)
+
     def __init__(self, token: str, parser: Parser) -> None:
         # This method is exactly the same as the original FilterExpression.__init__ method, the only difference being
-        # the value of `filter_re`.
+        # the value of `filter_re`, and that the method lookups used in the loop are bound only once.
         self.token = token
+        find_filter = parser.find_filter
+        args_check = self.args_check
         matches = filter_re.finditer(token)
         var_obj = None
         filters: List[Any] = []
@@ -83,8 +91,8 @@ class ComponentsFilterExpression(FilterExpression):
                     args.append((False, Variable(constant_arg).resolve({})))
                 elif var_arg:
                     args.append((True, Variable(var_arg)))
-                filter_func = parser.find_filter(filter_name)
-                self.args_check(filter_name, filter_func, args)
+                filter_func = find_filter(filter_name)
+                args_check(filter_name, filter_func, args)
                 filters.append((filter_func, args))
             upto = match.end()
         if upto != len(token):
@@ -93,6 +101,16 @@ class ComponentsFilterExpression(FilterExpression):
         self.filters = filters
         self.var = var_obj
         self.is_var = isinstance(var_obj, Variable)
+        # Literals without filters, like `key="val"` or `size=12`, resolve to the same value
+        # on every render, so we can skip the context lookup and filter handling.
+        self.is_literal = not filters and (
+            not self.is_var or (var_obj.lookups is None and not var_obj.translate)  # type: ignore[union-attr]
+        )
+
+    def resolve(self, context: Context, ignore_failures: bool = False) -> Any:
+        if self.is_literal:
+            return self.var.literal if self.is_var else self.var
+        return super().resolve(context, ignore_failures)
 
 
 ######################################################################################################################
@@ -259,16 +277,14 @@ def process_aggregate_kwargs(kwargs: Mapping[str, Any]) -> Dict[str, Any]:
     that input while still being able to provide their own keys.
     """
     processed_kwargs = {}
-    nested_kwargs: Dict[str, Dict[str, Any]] = {}
+    nested_kwargs: Dict[str, Dict[str, Any]] = defaultdict(dict)
     for key, val in kwargs.items():
         if ":" not in key:
             processed_kwargs[key] = val
             continue
 
         # NOTE: Trim off the prefix from keys
-        prefix, sub_key = key.split(":", 1)
-        if prefix not in nested_kwargs:
-            nested_kwargs[prefix] = {}
+        prefix, _, sub_key = key.partition(":")
         nested_kwargs[prefix][sub_key] = val
 
     # Assign aggregated values into normal input
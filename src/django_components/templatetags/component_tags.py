@@ -50,9 +50,10 @@ def get_components_from_registry(registry: ComponentRegistry) -> List["Component
 def get_components_from_preload_str(preload_str: str) -> List["Component"]:
     """Returns a list of unique components from a comma-separated str"""
 
+    # Use dict to dedupe the names while preserving their order
+    component_names = dict.fromkeys(name.strip() for name in preload_str.split(","))
     components = []
-    for component_name in preload_str.split(","):
-        component_name = component_name.strip()
+    for component_name in component_names:
         if not component_name:
             continue
         component_class = component_registry.get(component_name)
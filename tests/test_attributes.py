@@ -1,5 +1,6 @@
 from django.template import Context, Template, TemplateSyntaxError
 from django.utils.safestring import SafeString, mark_safe
+from django.utils.translation import gettext_lazy
 
 from django_components import component, types
 from django_components.attributes import append_attributes, attributes_to_string
@@ -72,6 +73,12 @@ class AppendAttributesTest(BaseTestCase):
             {"class": "foo baz", "id": "bar"},
         )
 
+    def test_appends_lazy_strings(self):
+        self.assertEqual(
+            append_attributes(("title", "foo"), ("title", gettext_lazy("bar"))),
+            {"title": "foo bar"},
+        )
+
 
 class HtmlAttrsTests(BaseTestCase):
     def setUp(self):
@@ -93,6 +93,17 @@ class ComponentTest(BaseTestCase):
             """,
         )
 
+    def test_template_string_compiled_once(self):
+        class SimpleComponent(component.Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+
+        comp = SimpleComponent("simple_component")
+        template_1 = comp.get_template(Context({}))
+        template_2 = comp.get_template(Context({}))
+        self.assertIs(template_1, template_2)
+
     @parametrize_context_behavior(["django", "isolated"])
     def test_template_string_dynamic(self):
         class SimpleComponent(component.Component):
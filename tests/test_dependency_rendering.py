@@ -5,7 +5,8 @@ from django.template import Template
 from django.test import override_settings
 
 from django_components import component, types
-from django_components.middleware import ComponentDependencyMiddleware
+from django_components.middleware import ComponentDependencyMiddleware, process_response_content
+from django_components.templatetags.component_tags import get_components_from_preload_str
 
 from .django_test_setup import *  # NOQA
 from .testutils import BaseTestCase, create_and_process_template_response
@@ -123,6 +124,16 @@ class ComponentMediaRenderingTests(BaseTestCase):
             count=1,
         )
 
+    def test_preload_str_dedupes_components(self):
+        component.registry.register(name="test", component=SimpleComponent)
+        component.registry.register(name="test2", component=SimpleComponentAlternate)
+
+        components = get_components_from_preload_str("test, test2,test,,")
+        self.assertListEqual(
+            [type(comp) for comp in components],
+            [SimpleComponent, SimpleComponentAlternate],
+        )
+
     def test_preload_css_dependencies_render_when_no_components_used(self):
         component.registry.register(name="test", component=SimpleComponent)
 
@@ -427,6 +438,10 @@ class ComponentMediaRenderingTests(BaseTestCase):
         request = Mock()
         self.assertEqual(response, middleware(request=request))
 
+    def test_middleware_content_without_placeholders_is_unchanged(self):
+        content = b"<html><body><script>let x = 1;</script></body></html>"
+        self.assertIs(process_response_content(content), content)
+
     def test_middleware_response_with_components_with_slash_dash_and_underscore(
         self,
     ):
@@ -1,5 +1,6 @@
 from django.template import Context, Template
 from django.template.base import Parser
+from django.template.engine import Engine
 
 # isort: off
 from .django_test_setup import *  # NOQA
@@ -54,6 +55,20 @@ class ParserTest(BaseTestCase):
             },
         )
 
+    def test_resolves_literal_kwargs(self):
+        bits = ["component", "my_component", "key='val'", "num=42", "upper='val'|upper", "var=myvar"]
+        parser = Parser("", builtins=Engine.get_default().template_builtins)
+        _, _, raw_kwargs = _parse_component_with_args(parser, bits, "component")
+
+        self.assertTrue(raw_kwargs["key"].is_literal)
+        self.assertTrue(raw_kwargs["num"].is_literal)
+        self.assertFalse(raw_kwargs["upper"].is_literal)
+        self.assertFalse(raw_kwargs["var"].is_literal)
+
+        ctx = Context({"myvar": "abc"})
+        kwargs = safe_resolve_dict(raw_kwargs, ctx)
+        self.assertDictEqual(kwargs, {"key": "val", "num": 42, "upper": "VAL", "var": "abc"})
+
 
 class ParserComponentTest(BaseTestCase):
     class SimpleComponent(component.Component):
@@ -599,3 +599,43 @@ class InjectTest(BaseTestCase):
         comp = InjectComponent("")
         with self.assertRaises(RuntimeError):
             comp.inject("abc", "def")
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_inject_reuses_payload_class_for_same_keys(self):
+        injected = []
+
+        @component.register("injectee")
+        class InjectComponent(component.Component):
+            template: types.django_html = """
+                <div> key: {{ key }} </div>
+            """
+
+            def get_context_data(self):
+                my_provide = self.inject("my_provide")
+                injected.append(my_provide)
+                return {"key": my_provide.key}
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% provide "my_provide" key="hi" another=123 %}
+                {% component "injectee" %}
+                {% endcomponent %}
+            {% endprovide %}
+            {% provide "my_provide" key="hello" another=456 %}
+                {% component "injectee" %}
+                {% endcomponent %}
+            {% endprovide %}
+        """
+        template = Template(template_str)
+        rendered = template.render(Context({}))
+
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <div> key: hi </div>
+            <div> key: hello </div>
+            """,
+        )
+        self.assertEqual(len(injected), 2)
+        self.assertIs(type(injected[0]), type(injected[1]))
+        self.assertEqual(injected[1], ("hello", 456))